@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import os, os.path, collections, yaml, schema, signal, sys, pathlib, logging, argparse, traceback, enum, re, copy
+import os, os.path, stat, collections, yaml, schema, signal, sys, logging, argparse, traceback, enum, re, copy, functools, urllib.parse, hashlib
 
 from PySide2 import QtCore
 from PySide2 import QtGui
@@ -33,15 +33,32 @@ gi.require_version('Gst', '1.0')
 from gi.repository import GObject, Gst, Gtk, GLib
 
 CACHE_SIZE = 256
+COVER_ART_CACHE_SIZE = 64
 SEEK_POS_UPDATER_INTERVAL_MS = 50
-SEEK_MIN_INTERVAL_MS = 200
+SEEK_POS_UPDATER_MAX_INTERVAL_MS = 200
+SEEK_DONE_TIMEOUT_MS = 500
+PLAYBACK_RATE_UPDATE_DELAY_MS = 30
+RESIZE_COLUMN_DELAY_MS = 50
+SELECTION_SETTLE_DELAY_MS = 40
+GST_BUS_MESSAGE_BATCH_SIZE = 16
 BLOCKING_GET_STATE_TIMEOUT = 1000 * Gst.MSECOND
 CONF_FILE = os.path.expanduser("~/.soundbrowser.conf.yaml")
 
+_MT_SEGMENT_DONE = Gst.MessageType.SEGMENT_DONE
+_MT_EOS = Gst.MessageType.EOS
+_MT_TAG = Gst.MessageType.TAG
+_MT_WARNING = Gst.MessageType.WARNING
+_MT_ERROR = Gst.MessageType.ERROR
+_MT_DURATION_CHANGED = Gst.MessageType.DURATION_CHANGED
+_MT_ASYNC_DONE = Gst.MessageType.ASYNC_DONE
+
+@functools.lru_cache(maxsize=64)
 def get_semitone_ratio(semitones):
     return pow(2, semitones/12.0)
 
 def log_callstack():
+    if not log.isEnabledFor(logging.DEBUG):
+        return
     log.debug(brightmagenta("callstack:\n" + "".join(traceback.format_list(traceback.extract_stack())[:-1])))
 
 def cyan(s):
@@ -124,21 +141,19 @@ _blacklisted_gst_audio_sink_factory_regexes = [
     '^interaudiosink$',
     '^ladspasink.*',
 ]
+_blacklisted_gst_audio_sink_factory_regex = re.compile('|'.join(f'(?:{r})' for r in _blacklisted_gst_audio_sink_factory_regexes))
 def get_available_gst_audio_sink_factories():
-    factories = Gst.Registry.get().get_feature_list(Gst.ElementFactory)
-    audio_sinks_factories = [ f for f in factories if ('Audio' in f.get_metadata('klass') and ('sink' in f.name or 'Sink' in f.get_metadata('klass'))) ]
-    for regex in _blacklisted_gst_audio_sink_factory_regexes:
-        audio_sinks_factories = [ f for f in audio_sinks_factories if not re.search(regex, f.name) ]
+    factories = Gst.ElementFactory.list_get_elements(Gst.ELEMENT_FACTORY_TYPE_SINK | Gst.ELEMENT_FACTORY_TYPE_MEDIA_AUDIO, Gst.Rank.NONE)
+    audio_sinks_factories = [ f for f in factories if not _blacklisted_gst_audio_sink_factory_regex.search(f.name) ]
     return { f.name: f for f in audio_sinks_factories }
 
+@functools.lru_cache(maxsize=None)
 def get_available_gst_factory_supported_properties(factory_name):
+    # cached: instantiates an element just to introspect it. Callers
+    # must not modify the returned dict
     element = Gst.ElementFactory.make(factory_name, None)
-    properties = {}
-    for p in element.list_properties():
-        if not(p.flags & GObject.ParamFlags.WRITABLE):
-            continue
-        properties[p.name] = p
-    return properties
+    writable = GObject.ParamFlags.WRITABLE
+    return { p.name: p for p in element.list_properties() if p.flags & writable }
 
 def set_state_blocking(element, state):
     r = element.set_state(state)
@@ -160,20 +175,27 @@ def query_seek(element):
         query_answer = query.parse_seeking()
     else:
         query_answer = None
-    log.debug(f"query seeking: ({query_retval}, {query_answer})")
+    log.debug("query seeking: (%s, %s)", query_retval, query_answer)
     return query_retval, query_answer
 
+_prop_true_strings = frozenset([ 'true', '1' ])
+
+def _cast_str_to_bool(s):
+    return s.lower() in _prop_true_strings
+
+# gtype name -> caster, properties of other types are passed as strings
+_prop_casters = {
+    'gchararray': str,
+    'gboolean': _cast_str_to_bool,
+    'gint': int,
+    'guint': int,
+    'gint64': int,
+    'guint64': int,
+    'gdouble': float,
+}
+
 def cast_str_to_prop_pytype(prop, s):
-    if prop.value_type.name == 'gchararray':
-        return s
-    elif prop.value_type.name == 'gboolean':
-        return s.lower() in [ 'true', '1' ]
-    elif prop.value_type.name in [ 'gint64', 'guint', 'gint64', 'gint' ]:
-        return int(s)
-    elif prop.value_type.name == 'gdouble':
-        return float(s)
-    else:
-        return s
+    return _prop_casters.get(prop.value_type.name, str)(s)
 
 class LRU(collections.OrderedDict):
     'Limit size, evicting the least recently looked-up key when full'
@@ -196,20 +218,24 @@ class LRU(collections.OrderedDict):
             log.debug(f"LRU max size, removing {oldest}")
             del self[oldest]
 
+# tag name -> Gst.TagList getter, for the tags that need no special handling
+_tag_getters = {
+    **dict.fromkeys([ 'title', 'artist', 'album', 'genre', 'musical-key', 'album-artist', 'encoder', 'channel-mode', 'audio-codec', 'container-format', 'comment' ], 'get_string'),
+    **dict.fromkeys([ 'track-count', 'track-number', 'minimum-bitrate', 'maximum-bitrate', 'bitrate' ], 'get_uint'),
+    **dict.fromkeys([ 'beats-per-minute', 'replaygain-track-gain', 'replaygain-album-gain', 'replaygain-track-peak', 'replaygain-album-peak' ], 'get_double'),
+    'duration': 'get_uint64',
+    'has-crc': 'get_boolean',
+}
+
 def parse_tag_list(taglist):
     tmp = {}
     containers = {}
     for i in range(taglist.n_tags()):
         tag = taglist.nth_tag_name(i)
         value = None
-        if tag in [ 'title', 'artist', 'album', 'genre', 'musical-key', 'album-artist', 'encoder', 'channel-mode', 'audio-codec', 'container-format', 'comment' ]:
-            value = taglist.get_string(tag)
-        elif tag in [ 'track-count', 'track-number', 'minimum-bitrate', 'maximum-bitrate', 'bitrate' ]:
-            value = taglist.get_uint(tag)
-        elif tag == 'duration':
-            value = taglist.get_uint64(tag)
-        elif tag in [  'beats-per-minute', 'replaygain-track-gain', 'replaygain-album-gain', 'replaygain-track-peak', 'replaygain-album-peak' ]:
-            value = taglist.get_double(tag)
+        getter = _tag_getters.get(tag)
+        if getter:
+            value = getattr(taglist, getter)(tag)
         elif tag == 'datetime':
             value = taglist.get_date_time(tag)
             if value[0]:
@@ -218,16 +244,12 @@ def parse_tag_list(taglist):
                 value = taglist.get_date(tag)
                 if value[0]:
                     value = (True, value[1].to_struct_tm()) # never tested, need to find an example stream
-        elif tag == 'has-crc':
-            value = taglist.get_boolean(tag)
         elif tag == 'image':
             value = taglist.get_sample(tag)
-            memmap = value[1].get_buffer().get_all_memory().map(Gst.MapFlags.READ)
-            bytearr = QtCore.QByteArray(memmap.data.tobytes())
-            img = QtGui.QImage()
-            img.loadFromData(bytearr)
-            img = QtGui.QPixmap(img)
-            value = (True, img)
+            if value[0]:
+                # raw encoded image, decoded later by a CoverArtDecoder
+                buf = value[1].get_buffer()
+                value = (True, buf.extract_dup(0, buf.get_size()))
         if value and value[0]:
             if tag == 'container-format':
                 containers[value[1]] = tmp
@@ -246,6 +268,7 @@ def get_milliseconds_suffix(secs):
         ms_suffix = ".%03i" % msecs
     return ms_suffix
 
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def format_duration(nsecs):
     if nsecs == None:
         return ''
@@ -275,14 +298,28 @@ def split_path_filename(s):
     else:
         return None, None
 
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def path_to_uri(path):
+    # same result as pathlib.Path(path).as_uri() for absolute posix paths
+    return 'file://' + urllib.parse.quote_from_bytes(os.fsencode(os.path.abspath(path)))
+
 def set_pixmap(qlabel, qpixmap):
     w = qlabel.width()
     h = qlabel.height()
     qlabel.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-    qlabel.setPixmap(qpixmap.scaled(w, h, QtCore.Qt.KeepAspectRatio))
+    pw = qpixmap.width()
+    ph = qpixmap.height()
+    if (pw == w and ph <= h) or (ph == h and pw <= w):
+        # already scaled to fit, e.g. by CoverArtDecoder
+        qlabel.setPixmap(qpixmap)
+    else:
+        qlabel.setPixmap(qpixmap.scaled(w, h, QtCore.Qt.KeepAspectRatio))
 
 def log_gst_message(message):
-    log.debug(cyan(f"gst message: {message.type.first_value_name}: {message.get_structure().to_string() if message.get_structure() else 'None'}"))
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    structure = message.get_structure()
+    log.debug(cyan(f"gst message: {message.type.first_value_name}: {structure.to_string() if structure else 'None'}"))
 
 class Sound(QtCore.QObject):
 
@@ -303,13 +340,46 @@ class Sound(QtCore.QObject):
             self.metadata[k].update(metadata[k])
             self.metadata['all'].update(metadata[k])
 
-def file_changed(sound):
+class CoverArtDecoder(QtCore.QRunnable):
+    # decodes an embedded image in a thread pool, QImage being usable
+    # outside of the gui thread, contrary to QPixmap. The image is
+    # also scaled to the cover art label size there, if known
+
+    def __init__(self, sound_browser, sound, container, key, data, size):
+        super().__init__()
+        self.sound_browser = sound_browser
+        self.sound = sound
+        self.container = container
+        self.key = key
+        self.data = data
+        self.size = size
+
+    def run(self):
+        img = QtGui.QImage()
+        img.loadFromData(self.data, len(self.data))
+        if self.size and not img.isNull():
+            img = img.scaled(self.size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.sound_browser.cover_art_decoded.emit(self.sound, self.container, self.key, img)
+
+def file_changed(sound, stat_result=None):
+    if stat_result == None:
+        try:
+            stat_result = os.stat(sound.path)
+        except:
+            log.debug(f"file_changed?: unable to stat {sound.path}")
+            return True
+    return stat_result.st_mtime_ns > sound.stat_result.st_mtime_ns
+
+def stat_regular_file(path):
+    # a single stat replacing os.path.isfile + os.stat. Returns None if
+    # not an existing regular file
     try:
-        stat_result = os.stat(sound.path)
+        stat_result = os.stat(path)
     except:
-        log.debug(f"file_changed?: unable to stat {sound.path}")
-        return True
-    return stat_result.st_mtime_ns > sound.stat_result.st_mtime_ns
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    return stat_result
 
 class SoundManager():
 
@@ -318,14 +388,15 @@ class SoundManager():
 
     def get(self, path, force_reload=False ):
         if path in self._cache and not force_reload:
-            if not os.path.isfile(path):
+            stat_result = stat_regular_file(path)
+            if stat_result == None:
                 log.debug(f"SoundManager: sound in cache, but there is no file anymore, discard it ({self._cache[path]})")
                 del self._cache[path]
                 return None
             sound = self._cache[path]
-            if file_changed(sound):
+            if file_changed(sound, stat_result):
                 log.debug(f"SoundManager: sound in cache but changed on disk, reload it ({self._cache[path]})")
-                return self._load(path)
+                return self._load(path, stat_result)
             return sound
         else:
             log.debug(f"SoundManager: sound not in cache, or reload forced, load it ({path})")
@@ -334,15 +405,12 @@ class SoundManager():
     def is_loaded(self, path):
         return path in self._cache
 
-    def _load(self, path):
-        if not os.path.isfile(path):
-            log.debug(f"SoundManager: not an existing file, unable to load {path}")
-            return None
-        try:
-            stat_result=os.stat(path)
-        except:
-            log.debug(f"SoundManager: unable to stat, unable to load {path}")
-            return None
+    def _load(self, path, stat_result=None):
+        if stat_result == None:
+            stat_result = stat_regular_file(path)
+            if stat_result == None:
+                log.debug(f"SoundManager: not an existing file, or unable to stat, unable to load {path}")
+                return None
         sound = Sound(path=path, stat_result=stat_result)
         self._cache[path] = sound
         return sound
@@ -407,16 +475,40 @@ class PrefsDialog(prefs_dial.Ui_PrefsDialog, QtWidgets.QDialog):
             self.specified_path.setText(path)
 
 # not to be confused with gst state which is only PLAYING or PAUSED
-SoundState = enum.Enum('SoundState', ['STOPPED', 'PLAYING', 'PAUSED'])
+SoundState = enum.IntEnum('SoundState', ['STOPPED', 'PLAYING', 'PAUSED'])
 
 class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     update_metadata_to_current_playing_message = QtCore.Signal()
     update_prefs_audio_sink_properties = QtCore.Signal()
+    cover_art_decoded = QtCore.Signal(object, object, object, object)
+
+    METADATA_FIELDS_DEFAULTS = (
+        ('title', ''),
+        ('artist', ''),
+        ('album', ''),
+        ('album_artist', ''),
+        ('track', '?/?'),
+        ('duration', ''),
+        ('genre', ''),
+        ('date', ''),
+        ('bpm', ''),
+        ('key', ''),
+        ('channel_mode', ''),
+        ('audio_codec', ''),
+        ('encoder', ''),
+        ('bitrate', '? (min=?/max=?)'),
+        ('comment', ''),
+    )
 
     def __init__(self, startup_path, clipboard, conf_file):
         super().__init__()
-        self._state = SoundState.STOPPED
+        self._state = None # first set to STOPPED in populate, so that it is a real transition
+        self.state_ui_updaters = {
+            SoundState.STOPPED: self.update_ui_to_stopped,
+            SoundState.PLAYING: self.update_ui_to_playing,
+            SoundState.PAUSED: self.update_ui_to_paused,
+        }
         self.clipboard = clipboard
         self.conf_file = conf_file
         self.config = load_conf(self.conf_file)
@@ -424,18 +516,54 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         self.manager = SoundManager()
         self.current_sound_selected = None
         self.current_sound_playing = None
+        self.current_sound_duration = None
+        self.cover_art_cache = LRU(maxsize = COVER_ART_CACHE_SIZE) # keys: sha1 digest of the image bytes. Values: QPixmap
+        self.cover_art_decoding = {} # keys: digests being decoded. Values: list of (sound, container) waiting for it
+        self.cover_art_size = None # cover art label size, known once shown
         self.setupUi(self)
         self.in_keyboard_press_event = False
+        self.preference_dialog = None # created on first use
+        self.resize_column_timer = QtCore.QTimer()
+        self.resize_column_timer.setSingleShot(True)
+        self.resize_column_timer.setInterval(RESIZE_COLUMN_DELAY_MS)
+        self.resize_column_timer.timeout.connect(self.resize_tableview_name_column)
+        self.selection_settle_timer = QtCore.QTimer()
+        self.selection_settle_timer.setSingleShot(True)
+        self.selection_settle_timer.setInterval(SELECTION_SETTLE_DELAY_MS)
+        self.selection_settle_timer.timeout.connect(self.selection_settled)
+        self.selection_pending_select = False
+        self.selection_pending_autoplay = False
         self.populate(startup_path)
         self.player = Gst.ElementFactory.make('playbin')
         self.player.set_property('flags', self.player.get_property('flags') & ~(0x00000001 | 0x00000004 | 0x00000008)) # disable video, subtitles, visualisation
         self.configure_audio_output()
+        self.gst_message_handlers = {
+            _MT_SEGMENT_DONE: self.gst_segment_done_handler,
+            _MT_EOS: self.gst_eos_handler,
+            _MT_TAG: self.gst_tag_handler,
+            _MT_WARNING: self.gst_warning_handler,
+            _MT_ERROR: self.gst_error_handler,
+            _MT_DURATION_CHANGED: self.gst_duration_changed_handler,
+            _MT_ASYNC_DONE: self.gst_async_done_handler,
+        }
         self.player.get_bus().add_watch(GLib.PRIORITY_DEFAULT, self.gst_bus_message_handler, None)
         self._playback_rate = 1.0
         self.seek_pos_update_timer = QtCore.QTimer()
-        self.seek_min_interval_timer = None
+        self.seek_pos_update_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.seek_pos_update_timer.setInterval(SEEK_POS_UPDATER_INTERVAL_MS)
+        self.seek_pos_update_timer.timeout.connect(self.seek_position_updater)
+        self.playback_rate_update_timer = QtCore.QTimer()
+        self.playback_rate_update_timer.setSingleShot(True)
+        self.playback_rate_update_timer.timeout.connect(self.update_playback_rate)
+        self.seek_in_flight = False
+        self.seek_done_timeout_timer = QtCore.QTimer()
+        self.seek_done_timeout_timer.setSingleShot(True)
+        self.seek_done_timeout_timer.setInterval(SEEK_DONE_TIMEOUT_MS)
+        self.seek_done_timeout_timer.timeout.connect(self.seek_done)
         self.seek_next_value = None
+        self.seek_last_value = None
         self.update_metadata_to_current_playing_message.connect(self.update_metadata_pane_to_current_playing)
+        self.cover_art_decoded.connect(self.update_cover_art, QtCore.Qt.QueuedConnection)
 
     def __str__(self):
         return f"SoundBrowser <state={self.state.name}, current_sound_selected={self.current_sound_selected} current_sound_playing={self.current_sound_playing}>"
@@ -446,18 +574,24 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     @state.setter
     def state(self, value):
+        if value is self._state:
+            return
         self._state = value
-        if value == SoundState.STOPPED:
-            self.play_button.setIcon(self.play_icon)
-            self.update_ui_to_selection()
-        elif value == SoundState.PLAYING:
-            self.play_button.setIcon(self.pause_icon)
-            self.play_button.setEnabled(True)
-            self.stop_button.setEnabled(True)
-        elif value == SoundState.PAUSED:
-            self.play_button.setIcon(self.play_icon)
-            self.play_button.setEnabled(True)
-            self.stop_button.setEnabled(True)
+        self.state_ui_updaters[value]()
+
+    def update_ui_to_stopped(self):
+        self.play_button.setIcon(self.play_icon)
+        self.update_ui_to_selection()
+
+    def update_ui_to_playing(self):
+        self.play_button.setIcon(self.pause_icon)
+        self.play_button.setEnabled(True)
+        self.stop_button.setEnabled(True)
+
+    def update_ui_to_paused(self):
+        self.play_button.setIcon(self.play_icon)
+        self.play_button.setEnabled(True)
+        self.stop_button.setEnabled(True)
 
     @property
     def playback_rate(self):
@@ -508,7 +642,7 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     def configure_audio_output(self):
         if self.config['gst_audio_sink']:
-            log.debug(f"check gst sink {self.config['gst_audio_sink']} available")
+            log.debug("check gst sink %s available", self.config['gst_audio_sink'])
             if self.config['gst_audio_sink'] not in self.available_gst_audio_sink_factories:
                 log.info(f"unavailable gstreamer audio sink '{self.config['gst_audio_sink']}', using default")
                 self.config['gst_audio_sink'] = ''
@@ -517,7 +651,7 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
                 self.config['gst_audio_sink_properties'][self.config['gst_audio_sink']] = {}
             available_properties = get_available_gst_factory_supported_properties(self.config['gst_audio_sink'])
             for config_prop in list(self.config['gst_audio_sink_properties'][self.config['gst_audio_sink']].keys()):
-                log.debug(f"check gst sink property {config_prop} available for {self.config['gst_audio_sink']}")
+                log.debug("check gst sink property %s available for %s", config_prop, self.config['gst_audio_sink'])
                 if config_prop not in available_properties:
                     log.info(f"unavailable gstreamer audio sink '{self.config['gst_audio_sink']}' property '{config_prop}', removing it from config")
                     del self.config['gst_audio_sink_properties'][self.config['gst_audio_sink']][config_prop]
@@ -535,6 +669,10 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     def populate(self, startup_path):
         set_dark_theme(self.config['dark_theme'])
+        self.metadata_fields_widgets = { field: (getattr(self, field), getattr(self, field + '_label'))
+                                         for field, _ in self.METADATA_FIELDS_DEFAULTS }
+        self.metadata_fields_clear_ops = [ self.metadata_fields_widgets[field] + (default_val,)
+                                           for field, default_val in self.METADATA_FIELDS_DEFAULTS ]
         self.fs_model = MyQFileSystemModel(self.config['show_hidden_files'], self)
         self.fs_model.setRootPath((QtCore.QDir.rootPath()))
         self.dir_model = QtWidgets.QFileSystemModel(self)
@@ -573,7 +711,9 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
                 startup_path = os.getcwd()
             elif self.config['startup_path_mode'] == STARTUP_PATH_MODE_HOME_DIR:
                 startup_path = os.path.expanduser('~')
-        self.goto_path(startup_path)
+        # navigate once the window is up, so that the first directory
+        # scan does not delay showing it
+        QtCore.QTimer.singleShot(0, functools.partial(self.goto_path, startup_path))
         self.treeView.header().setSortIndicator(0,QtCore.Qt.AscendingOrder)
         self.treeView.setSortingEnabled(True)
         self.treeView.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
@@ -598,16 +738,14 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         self.paste_path_button.clicked.connect(self.paste_path_clicked)
         self.play_button.clicked.connect(self.play_clicked)
         self.stop_button.clicked.connect(self.stop_clicked)
-        self.pause_icon = QtGui.QIcon(":/icons/pause.png")
-        self.play_icon = QtGui.QIcon(":/icons/play.png")
-        self.play_icon.addFile(":/icons/play_disabled.png", mode=QtGui.QIcon.Disabled)
+        self.play_icon, self.pause_icon = get_play_pause_icons()
         self.refresh_config()
         if self.config['main_window_geometry']:
-            self.restoreGeometry(QtCore.QByteArray(self.config['main_window_geometry']))
+            self.restoreGeometry(self.config['main_window_geometry'])
         if self.config['main_window_state']:
-            self.restoreState(QtCore.QByteArray(self.config['main_window_state']))
+            self.restoreState(self.config['main_window_state'])
         if self.config['splitter_state']:
-            self.splitter.restoreState(QtCore.QByteArray(self.config['splitter_state']))
+            self.splitter.restoreState(self.config['splitter_state'])
         self.tableView_contextMenu = QtWidgets.QMenu(self.tableView)
         reload_sound_action = QtWidgets.QAction("Reload", self.tableView)
         self.tableView_contextMenu.addAction(reload_sound_action)
@@ -643,49 +781,50 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         self.reverse_button.clicked.connect(self.reverse_clicked)
         reverse_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key_R), self)
         reverse_shortcut.activated.connect(self.reverse_shortcut_activated)
+        self.update_prefs_audio_sink_properties.connect(self.prefs_fill_audio_sink_properties, QtCore.Qt.QueuedConnection)
+        self.clear_metadata_pane()
+        self.tableView.setFocus()
+
+    def create_preference_dialog(self):
+        # built on first use only, most sessions never open it
         self.preference_dialog = PrefsDialog(self)
         self.preference_dialog.setMinimumSize(self.preference_dialog.size())
         self.preference_dialog.setMaximumSize(self.preference_dialog.size())
-        self.update_prefs_audio_sink_properties.connect(self.prefs_fill_audio_sink_properties, QtCore.Qt.QueuedConnection)
         prefs_audio_sink_properties_del_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key_Delete), self.preference_dialog.audio_output_properties)
         prefs_audio_sink_properties_del_shortcut.setContext(QtCore.Qt.WidgetWithChildrenShortcut)
         prefs_audio_sink_properties_del_shortcut.activated.connect(self.prefs_audio_sink_prop_del)
         prefs_audio_sink_properties_backspace_shortcut = QtWidgets.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key_Backspace), self.preference_dialog.audio_output_properties)
         prefs_audio_sink_properties_backspace_shortcut.setContext(QtCore.Qt.WidgetWithChildrenShortcut)
         prefs_audio_sink_properties_backspace_shortcut.activated.connect(self.prefs_audio_sink_prop_del)
-        self.clear_metadata_pane()
-        self.tableView.setFocus()
 
     def showEvent(self, event):
         self.image.setFixedWidth(self.metadata.height())
         self.image.setFixedHeight(self.metadata.height())
+        self.cover_art_size = self.image.size()
 
     def update_ui_to_selection(self):
-        if self.current_sound_selected:
-            self.play_button.setEnabled(True)
-            self.stop_button.setEnabled(True)
-            self.seek_slider.setEnabled(True)
-            self.seek_slider.setValue(0)
-        else:
-            self.play_button.setEnabled(False)
-            self.stop_button.setEnabled(False)
-            self.seek_slider.setEnabled(False)
-            self.seek_slider.setValue(0)
+        enabled = bool(self.current_sound_selected)
+        for w in (self.play_button, self.stop_button, self.seek_slider):
+            w.setEnabled(enabled)
+        self.seek_slider_setvalue(0)
 
     def goto_path(self, path):
         directory, filename = split_path_filename(path)
         if directory:
-            self.treeView.setCurrentIndex(self.fs_model.index(directory))
-            self.treeView.expand(self.fs_model.index(directory))
+            fs_index = self.fs_model.index(directory)
+            self.treeView.setCurrentIndex(fs_index)
+            self.treeView.expand(fs_index)
             self.config['last_path'] = directory
             if filename:
                 self.tableView.setRootIndex(self.dir_proxy_model.mapFromSource(self.dir_model.index(directory)))
                 self.tableView.selectRow(self.dir_proxy_model.mapFromSource(self.dir_model.index(path)).row())
                 self.config['last_path'] = path
 
-    def select_path(self):
-        fileinfo = self.dir_model.fileInfo(self.dir_proxy_model.mapToSource(self.tableView.currentIndex()))
-        filepath = self.tableview_get_path(self.tableView.currentIndex())
+    def select_path(self, src_index=None):
+        if src_index is None:
+            src_index = self.dir_proxy_model.mapToSource(self.tableView.currentIndex())
+        fileinfo = self.dir_model.fileInfo(src_index)
+        filepath = self.dir_model_get_path(src_index)
         self.locationBar.setText(filepath)
         if fileinfo.isFile():
             previous_current_sound_selected = self.current_sound_selected
@@ -699,74 +838,92 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
                 self.clear_metadata_pane()
         else:
             self.current_sound_selected = None
-        if self.state == SoundState.STOPPED:
+        if self.state is SoundState.STOPPED:
             self.update_ui_to_selection()
 
-    def update_metadata_field(self, field, value, force = None):
-        f = getattr(self, field)
-        l = getattr(self, field + '_label')
+    def update_metadata_field(self, widgets, value, force = None):
+        f, l = widgets
+        text = str(value)
+        if f.text() != text:
+            f.setText(text)
         if value or force == True:
-            f.setText(str(value))
             f.setEnabled(True)
             l.setEnabled(True)
         if not value or force == False:
-            f.setText(str(value))
             f.setEnabled(False)
             l.setEnabled(False)
 
     def clear_metadata_pane(self):
-        for field, default_val in [
-                ('title', ''),
-                ('artist', ''),
-                ('album', ''),
-                ('album_artist', ''),
-                ('track', '?/?'),
-                ('duration', ''),
-                ('genre', ''),
-                ('date', ''),
-                ('bpm', ''),
-                ('key', ''),
-                ('channel_mode', ''),
-                ('audio_codec', ''),
-                ('encoder', ''),
-                ('bitrate', '? (min=?/max=?)'),
-                ('comment', ''),
-                ]:
-            getattr(self, field).setText(default_val)
-            getattr(self, field).setEnabled(False)
-            getattr(self, field + '_label').setEnabled(False)
-        self.image.setPixmap(None)
+        self.bottom_pane.setUpdatesEnabled(False)
+        try:
+            for f, l, default_val in self.metadata_fields_clear_ops:
+                f.setText(default_val)
+                f.setEnabled(False)
+                l.setEnabled(False)
+            self.image.setPixmap(None)
+        finally:
+            self.bottom_pane.setUpdatesEnabled(True)
 
     def update_metadata_pane(self, metadata):
-        m = metadata['all']
-        self.update_metadata_field('title', m.get('title', ''))
-        self.update_metadata_field('artist', m.get('artist', ''))
-        self.update_metadata_field('album', m.get('album', ''))
-        self.update_metadata_field('album_artist', m.get('album-artist', ''))
-        self.update_metadata_field('track', str(m.get('track-number', '?')) + '/' + str(m.get('track-count', '?')),
-                                   True if ('track-number' in m or 'track-count' in m) else False)
-        self.update_metadata_field('duration', format_duration(m.get('duration')))
-        self.update_metadata_field('genre', m.get('genre', ''))
-        self.update_metadata_field('date', m.get('datetime', ''))
-        self.update_metadata_field('bpm', f"{m['beats-per-minute']:.2f}" if 'beats-per-minute' in m else '')
-        self.update_metadata_field('key', m.get('musical-key', ''))
-        self.update_metadata_field('channel_mode', m.get('channel-mode', ''))
-        self.update_metadata_field('audio_codec', m.get('audio-codec', ''))
-        self.update_metadata_field('encoder', m.get('encoder', ''))
-        self.update_metadata_field('bitrate', str(m.get('bitrate', '?')) + ' (min=' + str(m.get('minimum-bitrate', '?')) + '/max=' + str(m.get('maximum-bitrate', '?')) + ')',
-                                   True if 'bitrate' in m else False)
-        self.update_metadata_field('comment', m.get('comment', ''))
-        if m.get('image'):
-            set_pixmap(self.image, m.get('image'))
-        else:
-            self.image.setPixmap(None)
+        # one repaint of the whole pane instead of one per field
+        self.bottom_pane.setUpdatesEnabled(False)
+        try:
+            m = metadata['all']
+            w = self.metadata_fields_widgets
+            self.update_metadata_field(w['title'], m.get('title', ''))
+            self.update_metadata_field(w['artist'], m.get('artist', ''))
+            self.update_metadata_field(w['album'], m.get('album', ''))
+            self.update_metadata_field(w['album_artist'], m.get('album-artist', ''))
+            if 'track-number' in m or 'track-count' in m:
+                self.update_metadata_field(w['track'], f"{m.get('track-number', '?')}/{m.get('track-count', '?')}", True)
+            else:
+                self.update_metadata_field(w['track'], '?/?', False)
+            self.update_metadata_field(w['duration'], format_duration(m.get('duration')))
+            self.update_metadata_field(w['genre'], m.get('genre', ''))
+            self.update_metadata_field(w['date'], m.get('datetime', ''))
+            self.update_metadata_field(w['bpm'], f"{m['beats-per-minute']:.2f}" if 'beats-per-minute' in m else '')
+            self.update_metadata_field(w['key'], m.get('musical-key', ''))
+            self.update_metadata_field(w['channel_mode'], m.get('channel-mode', ''))
+            self.update_metadata_field(w['audio_codec'], m.get('audio-codec', ''))
+            self.update_metadata_field(w['encoder'], m.get('encoder', ''))
+            if 'bitrate' in m or 'minimum-bitrate' in m or 'maximum-bitrate' in m:
+                self.update_metadata_field(w['bitrate'], f"{m.get('bitrate', '?')} (min={m.get('minimum-bitrate', '?')}/max={m.get('maximum-bitrate', '?')})",
+                                           'bitrate' in m)
+            else:
+                self.update_metadata_field(w['bitrate'], '? (min=?/max=?)', False)
+            self.update_metadata_field(w['comment'], m.get('comment', ''))
+            if m.get('image'):
+                set_pixmap(self.image, m.get('image'))
+            else:
+                self.image.setPixmap(None)
+        finally:
+            self.bottom_pane.setUpdatesEnabled(True)
 
     @QtCore.Slot()
     def update_metadata_pane_to_current_playing(self):
         self.update_metadata_pane(self.current_sound_playing.metadata)
 
+    @QtCore.Slot()
+    def update_cover_art(self, sound, container, key, img):
+        waiting = self.cover_art_decoding.pop(key, [ (sound, container) ])
+        if img.isNull():
+            log.debug(f"unable to decode cover art of {sound}")
+            return
+        pixmap = QtGui.QPixmap.fromImage(img)
+        self.cover_art_cache[key] = pixmap
+        for waiting_sound, waiting_container in waiting:
+            waiting_sound.update_metadata({ waiting_container: { 'image': pixmap } })
+        if any(waiting_sound is self.current_sound_playing for waiting_sound, _ in waiting):
+            self.update_metadata_to_current_playing_message.emit()
+
     @QtCore.Slot()
     def dir_model_directory_loaded(self, path):
+        # directoryLoaded comes in bursts, resize only once per burst
+        if not self.resize_column_timer.isActive():
+            self.resize_column_timer.start()
+
+    @QtCore.Slot()
+    def resize_tableview_name_column(self):
         self.tableView.resizeColumnToContents(0)
 
     @QtCore.Slot()
@@ -774,18 +931,44 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         path = self.fs_model.filePath(self.treeView.currentIndex())
         self.locationBar.setText(path)
         self.tableView.setRootIndex(self.dir_proxy_model.mapFromSource(self.dir_model.index(path)))
-        self.treeView.setCurrentIndex(self.fs_model.index(path))
-        self.treeView.expand(self.fs_model.index(path))
+        fs_index = self.fs_model.index(path)
+        self.treeView.setCurrentIndex(fs_index)
+        self.treeView.expand(fs_index)
+
+    def dir_model_get_path(self, src_index):
+        return os.path.abspath(self.dir_model.filePath(src_index))
 
     def tableview_get_path(self, index):
-        return os.path.abspath(self.dir_model.filePath(self.dir_proxy_model.mapToSource(index)))
+        return self.dir_model_get_path(self.dir_proxy_model.mapToSource(index))
 
     @QtCore.Slot()
     def tableview_selection_changed(self, selected, deselected):
+        # when holding an arrow key, the selection changes for each row
+        # passed. Only the row where it settles is loaded (and
+        # autoplayed)
         if len(selected) == 1:
-            self.select_path()
+            self.selection_pending_select = True
         if self.in_keyboard_press_event and self.config['autoplay_keyboard']:
-            self.tableView_return_pressed(change_dir=False)
+            self.selection_pending_autoplay = True
+        self.selection_settle_timer.start()
+
+    def apply_pending_selection(self):
+        # a play request right after a selection change must act on the
+        # new selection, not wait for it to settle. A pending keyboard
+        # autoplay is superseded by the explicit request
+        if self.selection_settle_timer.isActive():
+            self.selection_settle_timer.stop()
+            self.selection_pending_autoplay = False
+            self.selection_settled()
+
+    @QtCore.Slot()
+    def selection_settled(self):
+        select, autoplay = self.selection_pending_select, self.selection_pending_autoplay
+        self.selection_pending_select = self.selection_pending_autoplay = False
+        if autoplay:
+            self.tableView_return_pressed(change_dir=False) # also selects the path
+        elif select:
+            self.select_path()
 
     def tableview_keyPressEvent(self, event):
         self.in_keyboard_press_event = True
@@ -794,16 +977,22 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     @QtCore.Slot()
     def tableView_return_pressed(self, change_dir=True):
+        # selects the path itself, a pending settled selection is redundant
+        self.selection_settle_timer.stop()
+        self.selection_pending_select = self.selection_pending_autoplay = False
         if len(self.tableView.selectionModel().selectedRows()) == 1:
-            self.select_path()
-            fileinfo = self.dir_model.fileInfo(self.dir_proxy_model.mapToSource(self.tableView.currentIndex()))
+            src_index = self.dir_proxy_model.mapToSource(self.tableView.currentIndex())
+            self.select_path(src_index)
+            fileinfo = self.dir_model.fileInfo(src_index)
             if fileinfo.isDir() and change_dir:
-                path = self.tableview_get_path(self.tableView.currentIndex())
+                path = self.dir_model_get_path(src_index)
                 self.tableView.setRootIndex(self.dir_proxy_model.mapFromSource(self.dir_model.index(path)))
-                self.treeView.setCurrentIndex(self.fs_model.index(path))
-                self.treeView.expand(self.fs_model.index(path))
+                fs_index = self.fs_model.index(path)
+                self.treeView.setCurrentIndex(fs_index)
+                self.treeView.expand(fs_index)
             elif fileinfo.isFile():
-                self.stop()
+                if self.state is not SoundState.STOPPED:
+                    self.stop()
                 self.play()
 
     @QtCore.Slot()
@@ -866,7 +1055,7 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
     @QtCore.Slot()
     def prefs_fill_audio_sink_properties(self):
         audiosink = self.preference_dialog.audio_output.currentText()
-        available_properties = get_available_gst_factory_supported_properties(audiosink)
+        available_properties = dict(get_available_gst_factory_supported_properties(audiosink))
         self.preference_dialog.audio_output_properties.blockSignals(True)
         self.preference_dialog.audio_output_properties.clear()
         self.preference_dialog.audio_output_properties.setHorizontalHeaderLabels([ 'property', 'value' ])
@@ -893,6 +1082,8 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     @QtCore.Slot()
     def prefs_button_clicked(self, checked = False):
+        if self.preference_dialog == None:
+            self.create_preference_dialog()
         self.tmpconfig = copy.deepcopy(self.config)
         self.preference_dialog.check_autoplay_mouse.setChecked(self.tmpconfig['autoplay_mouse'])
         self.preference_dialog.check_autoplay_keyboard.setChecked(self.tmpconfig['autoplay_keyboard'])
@@ -1004,6 +1195,7 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     @QtCore.Slot()
     def play_shortcut_activated(self):
+        self.apply_pending_selection() # may enable the play button
         self.play_button.click()
 
     @QtCore.Slot()
@@ -1032,7 +1224,8 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
 
     @QtCore.Slot()
     def play_clicked(self, checked):
-        if self.state in [ SoundState.STOPPED, SoundState.PAUSED ] :
+        self.apply_pending_selection()
+        if self.state is not SoundState.PLAYING:
             self.play()
         else:
             self.pause()
@@ -1041,6 +1234,12 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
     def stop_clicked(self, checked):
         self.stop()
 
+    def seek_slider_setvalue(self, value):
+        # programmatic slider moves must not be taken for user seeks
+        signals_blocked = self.seek_slider.blockSignals(True)
+        self.seek_slider.setValue(int(value))
+        self.seek_slider.blockSignals(signals_blocked)
+
     def get_slider_pos(self, mouse_event):
         return QtWidgets.QStyle.sliderValueFromPosition(self.seek_slider.minimum(), self.seek_slider.maximum(), mouse_event.pos().x(), self.seek_slider.geometry().width())
 
@@ -1052,7 +1251,8 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         return self.seek_slider.orig_mouseMoveEvent(mouse_event)
 
     def slider_mouseReleaseEvent(self, mouse_event):
-        if self.state in [ SoundState.PLAYING, SoundState.PAUSED ]:
+        self.apply_pending_selection()
+        if self.state is not SoundState.STOPPED:
             self.seek(self.get_slider_pos(mouse_event))
         else:
             if self.current_sound_selected:
@@ -1063,12 +1263,16 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
     @QtCore.Slot()
     def tune_dial_valueChanged(self, value):
         self.tune_value.setText(str(value))
-        self.update_playback_rate(value)
+        self._playback_rate = get_semitone_ratio(value)
+        log.debug("playback rate set to %s (%s semitones)", self.playback_rate, value)
+        # the dial emits a value for each step while dragged, so only
+        # seek the pipeline once it has settled
+        self.playback_rate_update_timer.start(PLAYBACK_RATE_UPDATE_DELAY_MS)
 
     def notify_sound_stopped(self):
         self.state = SoundState.STOPPED
         self.disable_seek_pos_updates()
-        self.seek_slider.setValue(100.0)
+        self.seek_slider_setvalue(100)
         log.debug(f"sound reached end")
 
     @QtCore.Slot()
@@ -1081,100 +1285,140 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         self.reverse_button.click()
 
     def gst_bus_message_handler(self, bus, message, *user_data):
-        if message.type == Gst.MessageType.SEGMENT_DONE:
-            log_gst_message(message)
-            if self.config['play_looped']:
-                # normal looping when no seeking has been done
-                got_seek_query_answer, seek_query_answer = query_seek(self.player)
-                if got_seek_query_answer and seek_query_answer.seekable:
-                    self.player.seek(self.playback_rate,
-                                     Gst.Format.TIME,
-                                     Gst.SeekFlags.SEGMENT,
-                                     Gst.SeekType.SET, seek_query_answer.segment_start,
-                                     Gst.SeekType.SET, seek_query_answer.segment_end)
-                else:
-                    self.player.seek(self.playback_rate,
-                                     Gst.Format.TIME,
-                                     Gst.SeekFlags.SEGMENT,
-                                     Gst.SeekType.SET, 0,
-                                     Gst.SeekType.NONE, -1)
-            else:
-                self.notify_sound_stopped()
-        elif message.type == Gst.MessageType.EOS:
-            log_gst_message(message)
-            if self.config['play_looped']:
-                # playing looped but a seek was done while playing
-                # so must do a full restart of the stream
-                self.player.set_state(Gst.State.PAUSED)
-                got_seek_query_answer, seek_query_answer = query_seek(self.player)
-                if got_seek_query_answer and seek_query_answer.seekable:
-                    self.player.seek(self.playback_rate,
-                                     Gst.Format.TIME,
-                                     Gst.SeekFlags.SEGMENT | Gst.SeekFlags.FLUSH,
-                                     Gst.SeekType.SET, seek_query_answer.segment_start,
-                                     Gst.SeekType.SET, seek_query_answer.segment_end)
-                else:
-                    self.player.seek(self.playback_rate,
-                                     Gst.Format.TIME,
-                                     Gst.SeekFlags.SEGMENT | Gst.SeekFlags.FLUSH,
-                                     Gst.SeekType.SET, 0,
-                                     Gst.SeekType.NONE, -1)
-                self.player.set_state(Gst.State.PLAYING)
-            else:
-                self.notify_sound_stopped()
-        elif message.type == Gst.MessageType.TAG:
-            message_struct = message.get_structure()
-            taglist = message.parse_tag()
-            metadata = parse_tag_list(taglist)
-            self.current_sound_playing.update_metadata(metadata)
-            self.update_metadata_to_current_playing_message.emit()
-        elif message.type == Gst.MessageType.WARNING:
-            log.warning(f"Gstreamer WARNING: {message.type}: {message.get_structure().to_string()}")
-        elif message.type == Gst.MessageType.ERROR:
-            log.warning(f"Gstreamer ERROR: {message.type}: {message.get_structure().to_string()}")
+        # also handle the messages already queued behind this one
+        # (bounded, to not starve the qt event loop)
+        self.handle_gst_message(message)
+        for _ in range(GST_BUS_MESSAGE_BATCH_SIZE - 1):
+            message = bus.pop()
+            if message is None:
+                break
+            self.handle_gst_message(message)
         return True
 
+    def handle_gst_message(self, message):
+        handler = self.gst_message_handlers.get(message.type)
+        if handler:
+            handler(message)
+
+    def gst_segment_done_handler(self, message):
+        log_gst_message(message)
+        if self.config['play_looped']:
+            # normal looping when no seeking has been done
+            self.seek_to_segment(Gst.SeekFlags.SEGMENT)
+        else:
+            self.notify_sound_stopped()
+
+    def gst_eos_handler(self, message):
+        log_gst_message(message)
+        if self.config['play_looped']:
+            # playing looped but a seek was done while playing
+            # so must do a full restart of the stream
+            self.player.set_state(Gst.State.PAUSED)
+            self.seek_to_segment(Gst.SeekFlags.SEGMENT | Gst.SeekFlags.FLUSH)
+            self.player.set_state(Gst.State.PLAYING)
+        else:
+            self.notify_sound_stopped()
+
+    def gst_tag_handler(self, message):
+        taglist = message.parse_tag()
+        metadata = parse_tag_list(taglist)
+        for container, tags in metadata.items():
+            if 'image' in tags:
+                # keyed by content, tracks of an album usually embed the
+                # same image, which is then decoded only once
+                key = hashlib.sha1(tags['image']).digest()
+                if key in self.cover_art_cache:
+                    tags['image'] = self.cover_art_cache[key]
+                elif key in self.cover_art_decoding:
+                    # several elements post the same image, decode it once
+                    tags.pop('image')
+                    self.cover_art_decoding[key].append((self.current_sound_playing, container))
+                else:
+                    self.cover_art_decoding[key] = [ (self.current_sound_playing, container) ]
+                    QtCore.QThreadPool.globalInstance().start(CoverArtDecoder(self, self.current_sound_playing, container, key, tags.pop('image'), self.cover_art_size))
+        self.current_sound_playing.update_metadata(metadata)
+        self.update_metadata_to_current_playing_message.emit()
+
+    def gst_warning_handler(self, message):
+        log.warning(f"Gstreamer WARNING: {_MT_WARNING}: {message.get_structure().to_string()}")
+
+    def gst_error_handler(self, message):
+        log.warning(f"Gstreamer ERROR: {_MT_ERROR}: {message.get_structure().to_string()}")
+
+    def gst_duration_changed_handler(self, message):
+        self.current_sound_duration = None
+
+    def gst_async_done_handler(self, message):
+        if self.seek_in_flight:
+            self.seek_done()
+
     @QtCore.Slot()
     def seek_position_updater(self):
-        got_duration, duration = self.player.query_duration(Gst.Format.TIME)
-        got_position, position = self.player.query_position(Gst.Format.TIME)
-        # log.debug(cyan(f"seek pos update got_position={got_position} position={position} got_duration={got_duration} duration={duration}"))
-        if got_duration:
+        # while a seek is in flight, the pipeline still reports the
+        # previous position, which would move the slider back
+        if self.seek_in_flight:
+            return
+        # the duration only needs to be queried until known, then
+        # again only if the pipeline reports a duration change
+        duration = self.current_sound_duration
+        if duration is None:
+            got_duration, duration = self.player.query_duration(Gst.Format.TIME)
+            if not got_duration:
+                return
+            self.current_sound_duration = duration
             if 'duration' not in self.current_sound_playing.metadata[None] or 'duration' not in self.current_sound_playing.metadata['all']:
                 self.current_sound_playing.metadata[None]['duration'] = self.current_sound_playing.metadata['all']['duration'] = duration
-                self.update_metadata_pane(self.current_sound_playing.metadata)
-            if got_position:
-                signals_blocked = self.seek_slider.blockSignals(True)
-                self.seek_slider.setValue(position * 100.0 / duration)
-                self.seek_slider.blockSignals(signals_blocked)
-                if position >= duration and not self.config['play_looped']:
-                    self.notify_sound_stopped()
+                if self.current_sound_playing is self.current_sound_selected:
+                    self.update_metadata_field(self.metadata_fields_widgets['duration'], format_duration(duration))
+                else:
+                    self.update_metadata_to_current_playing_message.emit()
+            self.update_seek_pos_update_interval()
+        got_position, position = self.player.query_position(Gst.Format.TIME)
+        # log.debug(cyan(f"seek pos update got_position={got_position} position={position} duration={duration}"))
+        if got_position:
+            value = int(position * 100.0 / duration)
+            if value != self.seek_slider.value():
+                self.seek_slider_setvalue(value)
+            if position >= duration and not self.config['play_looped']:
+                self.notify_sound_stopped()
+
+    def update_seek_pos_update_interval(self):
+        # poll about once per slider step: on long sounds, the slider
+        # moves much less often than every SEEK_POS_UPDATER_INTERVAL_MS
+        interval = SEEK_POS_UPDATER_INTERVAL_MS
+        if self.current_sound_duration and self.playback_rate:
+            steps = self.seek_slider.maximum() - self.seek_slider.minimum() + 1
+            step_ms = self.current_sound_duration / 1e6 / steps / abs(self.playback_rate)
+            interval = int(min(max(step_ms, SEEK_POS_UPDATER_INTERVAL_MS), SEEK_POS_UPDATER_MAX_INTERVAL_MS))
+        self.seek_pos_update_timer.setInterval(interval)
 
     def enable_seek_pos_updates(self):
-        log.debug(f"enable seek pos updates")
-        self.seek_pos_update_timer.timeout.connect(self.seek_position_updater)
-        self.seek_pos_update_timer.start(SEEK_POS_UPDATER_INTERVAL_MS)
+        log.debug("enable seek pos updates")
+        self.seek_pos_update_timer.start()
 
     def disable_seek_pos_updates(self):
-        log.debug(f"disable seek pos updates")
+        log.debug("disable seek pos updates")
         self.seek_pos_update_timer.stop()
 
     def update_player_path(self, sound):
-        log.debug(f"update_player_path to {sound.path}")
+        log.debug("update_player_path to %s", sound.path)
+        self.cancel_pending_seek()
         self.player.set_state(Gst.State.NULL)
-        uri = pathlib.Path(sound.path).as_uri()
-        self.player.set_property('uri', uri)
+        self.player.set_property('uri', path_to_uri(sound.path))
         self.current_sound_playing = sound
+        self.current_sound_duration = None
+        self.update_seek_pos_update_interval()
 
     def play(self, start_pos=None):
-        log.debug(f"play {self}")
+        log.debug("play %s, start_pos=%s", self, start_pos)
         if (not self.current_sound_selected) and (not self.current_sound_playing):
-            log.error(f"play called with no sound selected nor playing")
+            log.error("play called with no sound selected nor playing")
             return
-        if self.state == SoundState.PLAYING:
+        self.playback_rate_update_timer.stop() # play seeks with the current rate anyway
+        if self.state is SoundState.PLAYING:
             self.state = SoundState.STOPPED
             self.player.set_state(Gst.State.PAUSED)
-        if self.state == SoundState.STOPPED:
+        if self.state is SoundState.STOPPED:
             if self.current_sound_selected and self.current_sound_playing != self.current_sound_selected:
                 self.update_player_path(self.current_sound_selected)
             elif file_changed(self.current_sound_playing):
@@ -1200,63 +1444,89 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         self.enable_seek_pos_updates()
 
     def pause(self):
-        log.debug(f"pause {self}")
-        if not self.state == SoundState.PLAYING:
-            log.error(f"pause called with state = {self.state.name}")
+        log.debug("pause %s", self)
+        if self.state is not SoundState.PLAYING:
+            log.error("pause called with state = %s", self.state.name)
             return
         if not self.current_sound_playing:
-            log.error(f"pause called with current_sound_playing = {self.current_sound_playing}")
+            log.error("pause called with current_sound_playing = %s", self.current_sound_playing)
             return
         self.player.set_state(Gst.State.PAUSED)
         self.state = SoundState.PAUSED
         self.disable_seek_pos_updates()
 
     def stop(self):
-        log.debug(f"stop {self}")
+        log.debug("stop %s", self)
+        self.cancel_pending_seek()
         self.player.set_state(Gst.State.PAUSED)
-        got_seek_query_answer, seek_query_answer = query_seek(self.player)
-        if got_seek_query_answer and seek_query_answer.seekable:
-            self.player.seek(self.playback_rate,
-                             Gst.Format.TIME,
-                             Gst.SeekFlags.FLUSH,
-                             Gst.SeekType.SET, seek_query_answer.segment_start,
-                             Gst.SeekType.SET, seek_query_answer.segment_end)
-        else:
-            self.player.seek(self.playback_rate,
-                             Gst.Format.TIME,
-                             Gst.SeekFlags.FLUSH,
-                             Gst.SeekType.SET, 0,
-                             Gst.SeekType.NONE, -1)
+        self.seek_to_segment(Gst.SeekFlags.FLUSH)
         self.state = SoundState.STOPPED
         self.disable_seek_pos_updates()
         self._current_sound_playing = None
-        self.seek_slider.setValue(0.0)
+        self.seek_slider_setvalue(0)
+
+    def seek_to_segment(self, flags):
+        # seek to the whole seekable segment, or from the start if the
+        # pipeline can't tell
+        got_seek_query_answer, seek_query_answer = query_seek(self.player)
+        if got_seek_query_answer and seek_query_answer.seekable:
+            start, stop_type, stop = seek_query_answer.segment_start, Gst.SeekType.SET, seek_query_answer.segment_end
+        else:
+            start, stop_type, stop = 0, Gst.SeekType.NONE, -1
+        self.player.seek(self.playback_rate,
+                         Gst.Format.TIME,
+                         flags,
+                         Gst.SeekType.SET, start,
+                         stop_type, stop)
 
     def seek(self, position):
-        if self.seek_min_interval_timer != None:
-            log.debug(f"seek to {position} delayed to limit gst seek events frequency")
-            self.seek_next_value = position
+        # only one flushing seek is sent to gstreamer at a time. While
+        # it is in flight, only the last requested position is kept
+        if self.seek_in_flight:
+            if position == self.seek_last_value:
+                # back to the position already being sought to, the
+                # queued one is obsolete
+                self.seek_next_value = None
+            else:
+                log.debug("seek to %s delayed until the previous seek is done", position)
+                self.seek_next_value = position
         else:
-            self.actual_seek(position)
-            self.seek_next_value = None
-            self.seek_min_interval_timer = QtCore.QTimer()
-            self.seek_min_interval_timer.setSingleShot(True)
-            self.seek_min_interval_timer.timeout.connect(self.seek_min_interval_timer_fired)
-            self.seek_min_interval_timer.start(SEEK_MIN_INTERVAL_MS)
+            self.start_seek(position)
 
-    @QtCore.Slot()
-    def seek_min_interval_timer_fired(self):
-        if self.seek_next_value:
-            self.actual_seek(self.seek_next_value)
+    def start_seek(self, position):
+        self.actual_seek(position)
+        self.seek_last_value = position
+        self.seek_next_value = None
+        self.seek_in_flight = True
+        self.seek_done_timeout_timer.start()
+
+    def cancel_pending_seek(self):
+        # forget queued and in flight seeks, which would otherwise be
+        # applied after a stop or to a newly loaded sound
+        self.seek_done_timeout_timer.stop()
+        self.seek_in_flight = False
         self.seek_next_value = None
-        self.seek_min_interval_timer = None
+        self.seek_last_value = None
+
+    @QtCore.Slot()
+    def seek_done(self):
+        # called on the ASYNC_DONE following a flushing seek, or by
+        # seek_done_timeout_timer in case it never comes (e.g. the seek
+        # was refused). Then sends the trailing seek, if any
+        self.seek_done_timeout_timer.stop()
+        self.seek_in_flight = False
+        if self.seek_next_value is not None and self.seek_next_value != self.seek_last_value:
+            self.start_seek(self.seek_next_value)
+        else:
+            self.seek_next_value = None
 
     def actual_seek(self, position):
         got_duration, duration = self.player.query_duration(Gst.Format.TIME)
         got_seek_query, seek_query_answer = query_seek(self.player)
         if got_duration:
-            seek_pos = position * duration / 100.0
-            log.debug(f"seek to {format_duration(seek_pos)} {self}")
+            seek_pos = int(position * duration / 100.0)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("seek to %s %s", format_duration(seek_pos), self)
             if self.playback_rate > 0.0:
                 self.player.seek(self.playback_rate,
                                         Gst.Format.TIME,
@@ -1272,13 +1542,12 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
         else:
             log.warning(f"unable to seek to {position}%, couldn't get duration")
 
-    def update_playback_rate(self, value=None):
-        if value != None:
-            self._playback_rate = get_semitone_ratio(value)
-            log.debug(f"update playback rate to {self.playback_rate} ({value} semitones)")
-        else:
-            log.debug(f"update playback rate to {self.playback_rate}")
-        if self.state in [ SoundState.PLAYING, SoundState.PAUSED ]:
+    @QtCore.Slot()
+    def update_playback_rate(self):
+        log.debug("update playback rate to %s", self.playback_rate)
+        self.playback_rate_update_timer.stop()
+        self.update_seek_pos_update_interval()
+        if self.state is not SoundState.STOPPED:
             got_seek_query_answer, seek_query_answer = query_seek(self.player)
             got_position, position = self.player.query_position(Gst.Format.TIME)
             if got_position:
@@ -1311,6 +1580,14 @@ class SoundBrowser(main_win.Ui_MainWindow, QtWidgets.QMainWindow):
             else:
                 log.warning(f"update_playback_rate: got_position, position = {got_position}, {position}")
 
+@functools.lru_cache(maxsize=None)
+def get_play_pause_icons():
+    # the icons are immutable, build them once and share them
+    play_icon = QtGui.QIcon(":/icons/play.png")
+    play_icon.addFile(":/icons/play_disabled.png", mode=QtGui.QIcon.Disabled)
+    pause_icon = QtGui.QIcon(":/icons/pause.png")
+    return play_icon, pause_icon
+
 def set_dark_theme(dark):
     if dark:
         palette = QtGui.QPalette()